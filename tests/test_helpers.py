@@ -0,0 +1,135 @@
+import json
+import logging
+import os
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from ulog_scraper.spiders.log_downloader import (
+    DriverPool, _CONFIG_LINE, join_selectors, parse_config_file,
+    read_browser_session, split_selectors)
+
+
+def write_config(path, text, mtime):
+    path.write_text(text)
+    os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+class FakeDriver:
+    def __init__(self, healthy=True):
+        self.healthy = healthy
+        self.quit_called = False
+        self.cookies_deleted = False
+
+    @property
+    def current_url(self):
+        if not self.healthy:
+            raise RuntimeError("session is gone")
+        return 'about:blank'
+
+    def delete_all_cookies(self):
+        self.cookies_deleted = True
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def empty_pool(monkeypatch):
+    monkeypatch.setattr(DriverPool, '_free', [])
+
+
+def test_config_line_groups():
+    match = _CONFIG_LINE.match("  dv21 : March 2025 - April 2025  ")
+    assert match.group('name', 'start', 'end') == ('dv21', 'March 2025', 'April 2025')
+    assert _CONFIG_LINE.match("# a comment").group('name', 'bad') == (None, None)
+    assert _CONFIG_LINE.match("not a config line").group('bad') == "not a config line"
+
+
+def test_parse_config_file(tmp_path, caplog):
+    path = write_config(tmp_path / 'vehicles.conf',
+                        "# vehicles\n\ndv21: March 2025 - April 2025\ngarbage\nmxnt:May 2025-June 2025\n",
+                        1000)
+    with caplog.at_level(logging.WARNING):
+        configs = parse_config_file(path)
+
+    assert configs == (('dv21', 'March 2025', 'April 2025'), ('mxnt', 'May 2025', 'June 2025'))
+    assert "Could not parse line: garbage" in caplog.text
+
+
+def test_parse_config_file_cached_until_modified(tmp_path):
+    path = write_config(tmp_path / 'vehicles.conf', "DV21 : a - b\n", 2000)
+    first = parse_config_file(path)
+
+    # Same modification time: the cached result is returned without re-reading
+    write_config(tmp_path / 'vehicles.conf', "MXNT : c - d\n", 2000)
+    assert parse_config_file(path) is first
+
+    # A new modification time re-reads the file
+    os.utime(path, (2001, 2001))
+    assert parse_config_file(path) == (('MXNT', 'c', 'd'),)
+
+
+def test_read_browser_session(tmp_path):
+    path = tmp_path / 'session.json'
+    assert read_browser_session(str(path)) is None
+
+    path.write_text("not json")
+    assert read_browser_session(str(path)) is None
+
+    path.write_text(json.dumps({'command_executor': 'http://grid:4444'}))
+    assert read_browser_session(str(path)) is None
+
+    path.write_text(json.dumps({'command_executor': 'http://grid:4444', 'session_id': 'abc'}))
+    assert read_browser_session(str(path)) == ('http://grid:4444', 'abc')
+
+
+def test_driver_pool_reuses_released_driver(empty_pool):
+    driver = FakeDriver()
+    driver.pool_uses = 1
+    DriverPool.release(driver)
+
+    assert driver.cookies_deleted and not driver.quit_called
+    assert DriverPool.acquire(None) is driver
+    assert driver.pool_uses == 2
+
+
+def test_driver_pool_skips_dead_drivers(empty_pool):
+    live, dead = FakeDriver(), FakeDriver(healthy=False)
+    live.pool_uses = dead.pool_uses = 1
+    DriverPool._free.extend([live, dead])
+
+    assert DriverPool.acquire(None) is live
+    assert DriverPool._free == []
+
+
+def test_driver_pool_maxsize(empty_pool):
+    drivers = [FakeDriver() for _ in range(DriverPool.maxsize + 1)]
+    for driver in drivers:
+        driver.pool_uses = 1
+        DriverPool.release(driver)
+
+    assert DriverPool._free == drivers[:DriverPool.maxsize]
+    assert drivers[-1].quit_called
+
+
+def test_driver_pool_max_uses(empty_pool):
+    driver = FakeDriver()
+    driver.pool_uses = DriverPool.max_uses
+    DriverPool.release(driver)
+
+    assert driver.quit_called
+    assert DriverPool._free == []
+
+
+def test_split_and_join_selectors():
+    selectors = (
+        (By.CSS_SELECTOR, "a.one"),
+        (By.XPATH, "//a[1]"),
+        (By.CSS_SELECTOR, "a.two"),
+        (By.XPATH, "//a[2]"),
+    )
+    assert split_selectors(selectors) == (("a.one", "a.two"), ("//a[1]", "//a[2]"))
+    assert join_selectors(selectors) == ("a.one, a.two", "//a[1] | //a[2]")
+    assert join_selectors(((By.CSS_SELECTOR, "a"),)) == ("a", None)
@@ -22,6 +22,11 @@ ROBOTSTXT_OBEY = True
 # Configure maximum concurrent requests performed by Scrapy (default: 16)
 #CONCURRENT_REQUESTS = 32
 
+# Threads for DNS resolution and other blocking work, including the spider's
+# browser flow. Only read from the project settings when the reactor starts,
+# not from spider custom_settings.
+REACTOR_THREADPOOL_MAXSIZE = 20
+
 # Configure a delay for requests for the same website (default: 0)
 # See https://docs.scrapy.org/en/latest/topics/settings.html#download-delay
 # See also autothrottle settings and docs
@@ -87,6 +92,10 @@ ROBOTSTXT_OBEY = True
 #HTTPCACHE_IGNORE_HTTP_CODES = []
 #HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
 
+# Which screenshots to take: "none", "error" or "all". When unset, every step is
+# captured with -a debug=true and only error states are captured otherwise.
+#SCREENSHOT_LEVEL = "error"
+
 # Set settings whose default value is deprecated to a future-proof value
 TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
 FEED_EXPORT_ENCODING = "utf-8"
@@ -1,49 +1,450 @@
 # Basic imports
 import scrapy
-import time
 import os
 import json
 import logging
+import logging.handlers
+import queue
+import atexit
+import functools
+import re
+import threading
+import urllib3
+import base64
+from concurrent.futures import ThreadPoolExecutor
+
+# Scrapy/Twisted imports
+from scrapy import signals
+from scrapy.exceptions import DontCloseSpider
+from twisted.internet import threads
 
 # Selenium imports
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import (TimeoutException, StaleElementReferenceException,
+                                        NoSuchElementException, WebDriverException)
+
+# ClientConfig (Selenium 4.26+) lets remote sessions size their connection pool
+try:
+    from selenium.webdriver.remote.client_config import ClientConfig
+except ImportError:
+    ClientConfig = None
+
+# Optional .env support, read once when the module is imported
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    pass
+else:
+    load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Default credentials, used when none are passed as spider arguments
+_USERNAME = os.environ.get('AUTERION_USERNAME')
+_PASSWORD = os.environ.get('AUTERION_PASSWORD')
+
+# Selector lists, tried in order of preference. Within each list the cheapest,
+# most likely to match selectors come first: plain CSS selectors ahead of XPath,
+# and XPath with text or axis predicates (full DOM walks) only as fallbacks.
+# Where an element is only identified by its text, a broad CSS selector comes
+# first and the text is checked in JS by first_visible_match, so the XPath
+# fallbacks are only evaluated when none of the CSS candidates match.
+
+# Initial login button on the landing page
+_LOGIN_BUTTON_SELECTORS = (
+    (By.CSS_SELECTOR, "button.button-primary"),
+    (By.XPATH, "//button[contains(text(), 'Login')]"),
+    (By.XPATH, "//button[normalize-space()='Login']"),
+)
+
+# Email/username field on the login form
+_EMAIL_SELECTORS = (
+    (By.CSS_SELECTOR, "input[type='email']"),
+    (By.CSS_SELECTOR, "input[name='username']"),
+    (By.CSS_SELECTOR, "input[name='email']"),
+)
+
+# Continue/next button after entering the email
+_CONTINUE_SELECTORS = (
+    (By.CSS_SELECTOR, "button[type='submit']"),
+    (By.XPATH, "//button[contains(text(), 'Continue')]"),
+    (By.XPATH, "//button[contains(text(), 'Next')]"),
+)
+
+# Password field
+_PASSWORD_SELECTORS = (
+    (By.CSS_SELECTOR, "input[type='password']"),
+    (By.CSS_SELECTOR, "input[name='password']"),
+)
+
+# Final login submit button
+_SUBMIT_SELECTORS = (
+    (By.CSS_SELECTOR, "button[type='submit']"),
+    (By.XPATH, "//button[contains(text(), 'Sign in')]"),
+    (By.XPATH, "//button[contains(text(), 'Login')]"),
+)
+
+# Vehicles page search input
+_VEHICLE_SEARCH_SELECTORS = (
+    (By.CSS_SELECTOR, "input.search"),
+    (By.CSS_SELECTOR, "input[placeholder='dv21']"),
+    (By.CSS_SELECTOR, "input[type='text']"),
+    (By.XPATH, "//div[@class='search']//input"),
+)
+
+# Search input used when processing configured vehicles. Hidden and disabled
+# inputs are excluded by the selectors themselves, so the browser drops them
+# while matching.
+_SEARCH_INPUT_SELECTORS = (
+    (By.CSS_SELECTOR, "input.search:not([hidden]):not([disabled]):not([aria-hidden='true'])"),
+    (By.CSS_SELECTOR, "input[type='text']:not([hidden]):not([disabled]):not([aria-hidden='true'])"),
+    (By.XPATH, "//div[@class='search']//input[not(@hidden) and not(@disabled)]"),
+)
+
+# Vehicle links in the search results, matched against the vehicle name
+_VEHICLE_RESULT_SELECTORS = (
+    (By.CSS_SELECTOR, "a[href*='/vehicles/']"),
+)
+
+# "Astro DV21 (Nate)" link in the vehicles list
+_DV21_LINK_SELECTORS = (
+    (By.CSS_SELECTOR, "a[href='/vehicles/1661']"),
+    (By.XPATH, "//a[contains(@href, '/vehicles/1661')]"),
+    (By.XPATH, "//a[contains(text(), 'Astro DV21')]"),
+    (By.XPATH, "//a[contains(., 'DV21')]"),
+)
+
+# "All Flights" link on the vehicle details page
+_ALL_FLIGHTS_SELECTORS = (
+    (By.CSS_SELECTOR, "a[href='/flights?vehicle=1661&showRoute=true']"),
+    (By.XPATH, "//a[contains(@href, '/flights?vehicle=1661')]"),
+    (By.XPATH, "//a[contains(@class, 'button-link') and contains(text(), 'All Flights')]"),
+    (By.XPATH, "//a[text()='All Flights']"),
+)
+
+# MXNT entry in the flights list
+_MXNT_FLIGHT_SELECTORS = (
+    (By.CSS_SELECTOR, "tbody tr"),
+    (By.XPATH, "//tr[contains(., 'MXNT')]"),
+    (By.XPATH, "//a[contains(., 'MXNT')]"),
+    (By.XPATH, "//td[contains(., 'MXNT')]/parent::tr"),
+    (By.XPATH, "//span[contains(text(), 'MXNT')]/ancestor::tr"),
+)
+
+# "log" link on the flight details page
+_LOG_BUTTON_SELECTORS = (
+    (By.CSS_SELECTOR, "a[href*='/logs']"),
+    (By.XPATH, "//a[contains(@href, '/logs')]"),
+    (By.XPATH, "//a[text()='log']"),
+    (By.XPATH, "//span[text()='log']"),
+)
+
+# "View Analytics" button on the logs page
+_VIEW_ANALYTICS_SELECTORS = (
+    (By.CSS_SELECTOR, "a.button-default"),
+    (By.CSS_SELECTOR, "button.button-default"),
+    (By.XPATH, "//span[contains(text(), 'View Analytics')]"),
+    (By.XPATH, "//a[contains(text(), 'View Analytics')]"),
+    (By.XPATH, "//*[contains(text(), 'View Analytics')]"),
+)
+
+# "Download log" button on the analytics page. Only elements whose whole text
+# is "Download log" match, so another download control on the page ("Download
+# CSV", "Downloads", ...) is never taken for it.
+_DOWNLOAD_LOG_SELECTORS = (
+    (By.XPATH, "//button[normalize-space()='Download log'] | //a[normalize-space()='Download log']"),
+    (By.XPATH, "//*[@role='button'][normalize-space()='Download log']"),
+    (By.XPATH, "//span[normalize-space()='Download log']"),
+)
+
+# The Download log button, for waiting on
+_DOWNLOAD_READY_XPATH = " | ".join(selector for _, selector in _DOWNLOAD_LOG_SELECTORS)
+
+# Injected into every new document: counts in-flight fetch/XHR requests and
+# remembers when network activity last started or finished.
+_NETWORK_TRACKER_JS = """
+(() => {
+    if (window.__inflightRequests !== undefined) return;
+    window.__inflightRequests = 0;
+    window.__lastNetworkActivity = Date.now();
+    const start = () => { window.__inflightRequests++; window.__lastNetworkActivity = Date.now(); };
+    const end = () => { window.__inflightRequests--; window.__lastNetworkActivity = Date.now(); };
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function() {
+            start();
+            return originalFetch.apply(this, arguments).finally(end);
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        start();
+        this.addEventListener('loadend', end, {once: true});
+        try {
+            return originalSend.apply(this, arguments);
+        } catch (e) {
+            end();
+            throw e;
+        }
+    };
+})();
+"""
+
+# True once the document is loaded and no fetch/XHR has been in flight for
+# arguments[0] ms. Pages loaded before the tracker was installed fall back to
+# document.readyState alone.
+_NETWORK_IDLE_JS = """
+    if (document.readyState !== 'complete') return false;
+    if (window.__inflightRequests === undefined) return true;
+    return window.__inflightRequests === 0 && Date.now() - window.__lastNetworkActivity >= arguments[0];
+"""
+
+# Visibility test shared by every in-browser element lookup: the element takes
+# up space on the page (not display:none, not detached, no hidden ancestor) and
+# is not visibility:hidden. Unlike offsetParent, this also holds for
+# position:fixed elements such as toolbars and drawers.
+_IS_VISIBLE_JS = "const visible = e => e.getClientRects().length > 0 && getComputedStyle(e).visibility !== 'hidden';"
 
 def parse_config_file(config_file_path):
     """
     Parses the configuration file and returns a list of vehicle configs
     Format: "vehicle_name : start_date - end_date"
     
+    The parsed result is cached per file path and modification time, so
+    spiders created in the same process only re-read the file after it has
+    been changed.
+    
     Returns:
-        list of tuples: [(vehicle_name, start_date, end_date), ...]
+        tuple of tuples: ((vehicle_name, start_date, end_date), ...)
     """
-    vehicle_configs = []
+    return _parse_config_cached(config_file_path, os.path.getmtime(config_file_path))
+
+# One config line: a comment, "vehicle_name : start_date - end_date", or anything
+# else (reported as unparseable). Blank lines don't match at all.
+_CONFIG_LINE = re.compile(
+    r'^[^\S\n]*(?:#.*'
+    r'|(?P<name>[^:\n]*?)[^\S\n]*:[^\S\n]*(?P<start>.*?)[^\S\n]*-[^\S\n]*(?P<end>.*?)'
+    r'|(?P<bad>\S.*?))[^\S\n]*$',
+    re.M)
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_cached(config_file_path, mtime):
+    """
+    Parse the configuration file; cached by parse_config_file.
+    
+    The whole file is scanned with one compiled regex instead of stripping
+    and splitting each line in Python.
     
+    Args:
+        config_file_path (str): Path of the configuration file
+        mtime (float): Modification time of the file, part of the cache key
+        
+    Returns:
+        tuple of tuples: ((vehicle_name, start_date, end_date), ...)
+    """
     with open(config_file_path, 'r') as file:
-        for line in file:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue  # Skip empty lines and comments
-                
-            # Parse line in format "vehicle_name : start_date - end_date"
+        text = file.read()
+    
+    vehicle_configs = []
+    for match in _CONFIG_LINE.finditer(text):
+        if match.group('bad'):
+            logger.warning("Could not parse line: %s", match.group('bad'))
+        elif match.group('name') is not None:
+            vehicle_configs.append((match.group('name'), match.group('start'), match.group('end')))
+    
+    return tuple(vehicle_configs)
+
+@functools.lru_cache(maxsize=None)
+def split_selectors(selectors):
+    """
+    Split a selector tuple into its CSS selectors and XPath expressions.
+    
+    The selector lists are module constants, so each one is only split once.
+    
+    Args:
+        selectors (tuple): (By.CSS_SELECTOR | By.XPATH, selector) pairs
+        
+    Returns:
+        tuple: (css_selectors, xpath_expressions), each a tuple in list order
+    """
+    css_list = tuple(selector for selector_type, selector in selectors if selector_type == By.CSS_SELECTOR)
+    xpath_list = tuple(selector for selector_type, selector in selectors if selector_type == By.XPATH)
+    return css_list, xpath_list
+
+@functools.lru_cache(maxsize=None)
+def join_selectors(selectors):
+    """
+    Combine a selector tuple into one CSS group selector and one XPath union.
+    
+    Args:
+        selectors (tuple): (By.CSS_SELECTOR | By.XPATH, selector) pairs
+        
+    Returns:
+        tuple: ("a, b, c" or None, "//a | //b" or None)
+    """
+    css_list, xpath_list = split_selectors(selectors)
+    return ", ".join(css_list) or None, " | ".join(xpath_list) or None
+
+def read_browser_session(session_file_path):
+    """
+    Reads the WebDriver session details saved by a previous run
+    Format: {"command_executor": <url>, "session_id": <id>}
+    
+    Returns:
+        tuple: (command_executor_url, session_id), or None if not available
+    """
+    if not os.path.exists(session_file_path):
+        return None
+    
+    try:
+        with open(session_file_path, 'r') as file:
+            session_details = json.load(file)
+    except ValueError:
+        return None
+    
+    command_executor_url = session_details.get('command_executor')
+    session_id = session_details.get('session_id')
+    if not command_executor_url or not session_id:
+        return None
+    return command_executor_url, session_id
+
+def executor_url(command_executor):
+    """
+    Return the Selenium server URL a driver's RemoteConnection talks to.
+    
+    Selenium 4.26+ keeps it on the connection's ClientConfig; older versions
+    only have the private _url attribute.
+    
+    Args:
+        command_executor (RemoteConnection): The driver's command_executor
+        
+    Returns:
+        str: The server URL
+    """
+    client_config = getattr(command_executor, '_client_config', None)
+    if client_config is not None:
+        return client_config.remote_server_addr
+    return command_executor._url
+
+def remote_connection_kwargs(command_executor, pool_maxsize):
+    """
+    Build the webdriver.Remote arguments for a Selenium server URL.
+    
+    Where Selenium supports it, the connection pool is sized through a
+    ClientConfig, so it is already wide enough for the new-session request
+    and every command after it.
+    
+    Args:
+        command_executor (str): Selenium server URL
+        pool_maxsize (int): Connections to keep open to the server
+        
+    Returns:
+        dict: Keyword arguments for webdriver.Remote
+    """
+    kwargs = {'command_executor': command_executor}
+    if ClientConfig is not None:
+        kwargs['client_config'] = ClientConfig(
+            remote_server_addr=command_executor,
+            init_args_for_pool_manager={'init_args_for_pool_manager': {'maxsize': pool_maxsize}})
+    return kwargs
+
+class AttachedRemote(webdriver.Remote):
+    """
+    Remote WebDriver that attaches to an already running session.
+    
+    Skips the new-session handshake so commands go straight to the browser
+    left open by a previous run, including its logged-in state.
+    """
+    def __init__(self, command_executor, session_id, options, pool_maxsize=1):
+        self.attached_session_id = session_id
+        super(AttachedRemote, self).__init__(options=options,
+                                             **remote_connection_kwargs(command_executor, pool_maxsize))
+    
+    def start_session(self, capabilities, *args, **kwargs):
+        self.session_id = self.attached_session_id
+        self.caps = capabilities
+
+class DriverPool:
+    """
+    Process-wide pool of idle WebDriver instances.
+    
+    Starting Chrome costs a few seconds, so drivers released by a finished
+    spider are kept and handed to the next spider created in the same process.
+    At most maxsize idle drivers are kept, and a driver is retired after
+    max_uses spiders so a long-lived Chrome's memory growth doesn't carry on
+    indefinitely. Idle drivers are quit when the process exits.
+    """
+    maxsize = 4
+    max_uses = 50
+    _free = []
+    
+    @classmethod
+    def acquire(cls, opts, command_executor=None, pool_maxsize=1):
+        """
+        Return a healthy idle driver, or start a new one.
+        
+        Args:
+            opts (Options): Chrome options for a new driver
+            command_executor (str, optional): Selenium server URL for a new driver
+            pool_maxsize (int, optional): Connection pool size for a new remote driver
+            
+        Returns:
+            WebDriver: A ready-to-use driver
+        """
+        while cls._free:
+            driver = cls._free.pop()
             try:
-                vehicle_part, date_part = line.split(':', 1)
-                vehicle_name = vehicle_part.strip()
-                
-                start_date_str, end_date_str = date_part.split('-', 1)
-                start_date = start_date_str.strip()
-                end_date = end_date_str.strip()
-                
-                vehicle_configs.append((vehicle_name, start_date, end_date))
-            except ValueError:
-                print(f"Warning: Could not parse line: {line}")
+                driver.current_url  # health check
+            except Exception:
+                continue
+            driver.pool_uses += 1
+            return driver
+        
+        if command_executor:
+            driver = webdriver.Remote(options=opts, **remote_connection_kwargs(command_executor, pool_maxsize))
+        else:
+            driver = webdriver.Chrome(options=opts)
+        driver.pool_uses = 1
+        return driver
     
-    return vehicle_configs
+    @classmethod
+    def release(cls, driver):
+        """
+        Return a driver to the pool, clearing its cookies first.
+        
+        The driver is quit instead if the pool is full or the driver has been
+        used max_uses times.
+        
+        Args:
+            driver (WebDriver): The driver to release
+        """
+        try:
+            if len(cls._free) >= cls.maxsize or getattr(driver, 'pool_uses', 0) >= cls.max_uses:
+                driver.quit()
+                return
+            driver.delete_all_cookies()
+            cls._free.append(driver)
+        except Exception:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+    
+    @classmethod
+    def shutdown(cls):
+        """Quit every idle driver in the pool"""
+        while cls._free:
+            try:
+                cls._free.pop().quit()
+            except Exception:
+                pass
+
+atexit.register(DriverPool.shutdown)
 
 class LogDownloaderSpider(scrapy.Spider):
     """
@@ -61,8 +462,37 @@ class LogDownloaderSpider(scrapy.Spider):
     """
     name = 'log_downloader'
     allowed_domains = ['suite.auterion.com']
+    custom_settings = {
+        # Log downloads are network-bound and all go to one domain, so let
+        # Scrapy pipeline them instead of queueing behind the per-domain limit
+        'CONCURRENT_REQUESTS': 32,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 16,
+        'DOWNLOAD_DELAY': 0,
+        # ULog files can exceed the default 1 GB download size limit
+        'DOWNLOAD_MAXSIZE': 0,
+        # Back off automatically rather than hammering Auterion Suite
+        'AUTOTHROTTLE_ENABLED': True,
+    }
+    browser_marker_file = 'browser_open.txt'
+    browser_session_file = 'logs/session.json'
+    download_dir = 'logs/downloaded'
+    download_index_file = 'logs/downloaded/downloaded.json'
+    cookie_file = 'logs/cookies.json'
+    navigation_state_file = 'logs/state.json'
+    download_timeout = 120
+    # Large ULog files fetched by Scrapy can outlast the default 180s timeout
+    http_download_timeout = 600
+    webdriver_pool_maxsize = 20
+    wait_poll_frequency = 0.1
+    # How long to wait for the network to go quiet after login
+    network_idle_timeout = 10
+    # Last content written to browser_marker_file by this process
+    _browser_marker_content = None
+    # Deferred for the browser flow run by start_requests
+    _browser_flow = None
     
-    def __init__(self, config_file=None, username=None, password=None, *args, **kwargs):
+    def __init__(self, config_file=None, username=None, password=None, debug=False,
+                 command_executor=None, reuse_session=True, headless=False, *args, **kwargs):
         """
         Initialize the spider with credentials and set up logging and browser.
         
@@ -72,23 +502,34 @@ class LogDownloaderSpider(scrapy.Spider):
                                      will be read from environment variable.
             password (str, optional): Auterion Suite password. If not provided, 
                                      will be read from environment variable.
+            debug (bool, optional): Take screenshots at each step of the flow.
+                                    Screenshots on errors are always taken.
+                                    The SCREENSHOT_LEVEL setting overrides both.
+            command_executor (str, optional): URL of a Selenium Grid or standalone
+                                              server to create sessions on instead
+                                              of starting a local Chrome.
+            reuse_session (bool, optional): Reattach to the browser left open by a
+                                            previous run if it is still alive. Only
+                                            sessions on a Selenium server can be
+                                            reattached: a local chromedriver is
+                                            stopped when its process exits.
+            headless (bool, optional): Run Chrome without a window, for unattended
+                                       runs where nobody inspects the browser.
         """
         super(LogDownloaderSpider, self).__init__(*args, **kwargs)
         
+        # Spider arguments passed with -a arrive as strings
+        self.debug = str(debug).lower() in ('1', 'true', 'yes')
+        self.command_executor = command_executor
+        self.reuse_session = str(reuse_session).lower() in ('1', 'true', 'yes')
+        self.headless = str(headless).lower() in ('1', 'true', 'yes')
+        
         # Setup logging
         self.setup_logger()
         
-        # Load environment variables
-        try:
-            from dotenv import load_dotenv
-            load_dotenv()
-            self.log("Loaded .env file")
-        except ImportError:
-            self.log("python-dotenv not installed, skipping .env file loading", logging.WARNING)
-        
         # Store credentials
-        self.username = username or os.environ.get('AUTERION_USERNAME')
-        self.password = password or os.environ.get('AUTERION_PASSWORD')
+        self.username = username or _USERNAME
+        self.password = password or _PASSWORD
         
         if not self.username or not self.password:
             self.log("Username and password must be provided", logging.ERROR)
@@ -97,138 +538,995 @@ class LogDownloaderSpider(scrapy.Spider):
         # Parse config file if provided
         self.config_file = config_file or 'vehicle_logs.conf'
         self.vehicle_configs = parse_config_file(self.config_file)
-        self.log(f"Loaded {len(self.vehicle_configs)} vehicle configurations")
+        self.logger.info("Loaded %s vehicle configurations", len(self.vehicle_configs))
         
-        # Vehicle processing state
-        self.current_vehicle_index = 0
+        # Chrome saves downloaded logs here
+        os.makedirs(self.download_dir, exist_ok=True)
+        self.downloaded_logs = self.load_download_index()
+        # Downloads are recorded from both the browser thread and the reactor
+        self._state_lock = threading.RLock()
+        
+        # Browser cookies for Scrapy requests, captured after login
+        self.session_cookies = None
+        
+        # Screenshots are written on a background thread, started on first use
+        self._screenshot_executor = None
         
         # Initialize Selenium driver
-        self.driver = webdriver.Chrome()
+        self.driver = self.create_driver()
+        self.configure_connection_pool()
+        self.configure_downloads()
+        self.configure_network_tracking()
+        # WebDriverWait instances reused across waits, keyed by timeout
+        self._waits = {}
+        # Download events picked out of the performance log
+        self._download_names = {}
+        self._completed_downloads = []
         self.log("Selenium driver initialized")
         
+    def create_driver(self):
+        """
+        Create the WebDriver, reattaching to a previous run's browser if possible.
+        
+        The browser left open by a previous run is recorded in the session file.
+        If that session still responds, it is reused and the login flow can be
+        skipped; otherwise a driver is taken from the DriverPool, which starts a
+        new session on the configured Selenium server or in a local Chrome when
+        no idle driver is available.
+        
+        Returns:
+            WebDriver: The driver to use for this run
+        """
+        self.session_reused = False
+        opts = self.build_chrome_options()
+        
+        saved_session = read_browser_session(self.browser_session_file) if self.reuse_session else None
+        if saved_session:
+            command_executor_url, session_id = saved_session
+            try:
+                driver = AttachedRemote(command_executor_url, session_id, opts, self.webdriver_pool_maxsize)
+                # Trivial command to check the session is still alive
+                self.logger.info("Reattached to existing browser session at: %s", driver.current_url)
+                self.session_reused = True
+                return driver
+            except Exception as e:
+                self.logger.warning("Could not reattach to saved browser session: %s", e)
+        
+        return DriverPool.acquire(opts, self.command_executor, self.webdriver_pool_maxsize)
+    
+    def configure_connection_pool(self):
+        """
+        Widen the HTTP connection pool the driver uses to talk to chromedriver.
+        
+        Selenium's pool holds a single connection, so any concurrent command (a
+        wait polling alongside the main flow, parallel downloads) queues behind
+        the one in flight and logs "connection pool is full" warnings.
+        
+        On Selenium 4.26+ the pool size is set on the connection's own
+        ClientConfig and the pool rebuilt from it, which keeps its proxy,
+        certificate and timeout settings. Remote sessions created through
+        remote_connection_kwargs are already sized and left alone. Older
+        versions get a plain pool.
+        """
+        executor = self.driver.command_executor
+        client_config = getattr(executor, '_client_config', None)
+        if client_config is not None:
+            pool_args = client_config.init_args_for_pool_manager.setdefault('init_args_for_pool_manager', {})
+            if pool_args.get('maxsize', 1) >= self.webdriver_pool_maxsize:
+                return
+            pool_args['maxsize'] = self.webdriver_pool_maxsize
+            if hasattr(executor, '_conn'):
+                executor._conn.clear()
+                executor._conn = executor._get_connection_manager()
+        elif hasattr(executor, '_conn'):
+            # 120s matches Selenium's default remote command timeout
+            executor._conn = urllib3.PoolManager(maxsize=self.webdriver_pool_maxsize, timeout=120)
+    
+    def configure_downloads(self):
+        """
+        Direct browser downloads into the downloads folder through DevTools.
+        
+        The download prefs in build_chrome_options only apply to a browser this
+        spider launched; a pooled or reattached browser is pointed at the folder
+        here. Only Chromium drivers expose DevTools commands.
+        """
+        if not hasattr(self.driver, 'execute_cdp_cmd'):
+            return
+        try:
+            self.driver.execute_cdp_cmd('Browser.setDownloadBehavior', {
+                'behavior': 'allow',
+                'downloadPath': os.path.abspath(self.download_dir),
+                'eventsEnabled': True,
+            })
+        except Exception as e:
+            self.logger.warning("Could not set download behavior: %s", e)
+    
+    def configure_network_tracking(self):
+        """
+        Install the fetch/XHR tracker used by is_network_idle in every new page.
+        
+        readyState is 'complete' as soon as the SPA's HTML has loaded, well
+        before its API calls have finished, so after login the spider also
+        waits briefly for network idle. Only Chromium drivers expose DevTools
+        commands.
+        """
+        if not hasattr(self.driver, 'execute_cdp_cmd'):
+            return
+        try:
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _NETWORK_TRACKER_JS})
+        except Exception as e:
+            self.logger.warning("Could not install network tracker: %s", e)
+    
+    def is_network_idle(self, driver, quiet_ms=500):
+        """
+        Check whether the page has loaded and its network has gone quiet.
+        
+        Args:
+            driver (WebDriver): The driver, as passed to wait conditions
+            quiet_ms (int): How long no fetch/XHR may have been in flight
+            
+        Returns:
+            bool: True if no request is in flight and none was for quiet_ms
+        """
+        return driver.execute_script(_NETWORK_IDLE_JS, quiet_ms)
+    
+    def build_chrome_options(self):
+        """
+        Build the Chrome options used to construct the WebDriver.
+        
+        Uses the 'eager' page load strategy so driver.get() and click navigations
+        return once the DOM is ready rather than after every image, font and
+        analytics request has finished. Every step waits on the element it needs
+        explicitly, so the remaining asset loading does not need to block.
+        
+        Images and notifications are disabled as the spider only ever looks
+        elements up by selector, which cuts the bytes and memory used per page.
+        Images stay enabled in debug mode so step screenshots are readable.
+        
+        With headless set, Chrome runs without a window, which also skips
+        compositing and painting to the screen.
+        
+        Returns:
+            Options: Configured Chrome options
+        """
+        opts = Options()
+        opts.page_load_strategy = 'eager'
+        
+        # Block notification prompts, and images unless screenshots are wanted
+        prefs = {
+            "profile.default_content_setting_values.notifications": 2,
+            # Save downloads without prompting where wait_for_download looks for them
+            "download.default_directory": os.path.abspath(self.download_dir),
+            "download.prompt_for_download": False,
+        }
+        if not self.debug:
+            prefs["profile.managed_default_content_settings.images"] = 2
+            opts.add_argument("--blink-settings=imagesEnabled=false")
+        opts.add_experimental_option("prefs", prefs)
+        opts.add_argument("--disable-dev-shm-usage")
+        opts.add_argument("--disable-gpu")
+        if self.headless:
+            opts.add_argument("--headless=new")
+        
+        # Keep page events, for download progress. Network events are not
+        # needed and would be buffered for every request the SPA makes.
+        opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        opts.add_experimental_option("perfLoggingPrefs", {"enableNetwork": False, "enablePage": True})
+        return opts
+    
     def setup_logger(self):
         """
         Set up a file logger in addition to the console logger.
         
-        Creates a logs directory if it doesn't exist and configures a file handler
-        to log messages to logs/scraper.log.
+        Creates a logs directory if it doesn't exist and attaches a queue handler
+        to the spider's own logger, so every record reaches the console (through
+        Scrapy's root handler) and logs/scraper.log exactly once. Records are
+        written to the file by a background QueueListener thread, so logging
+        calls don't wait on disk I/O. The listener is stopped, flushing any
+        queued records, when the process exits.
+        
+        The handler is only installed if the logger doesn't already have one
+        for that file, so creating several spiders does not duplicate log
+        records.
         """
+        logger = self.logger.logger
+        log_path = os.path.abspath('logs/scraper.log')
+        if any(getattr(handler, 'log_path', None) == log_path for handler in logger.handlers):
+            return
+        
         # Create logs directory if it doesn't exist
         os.makedirs('logs', exist_ok=True)
         
         # Set up the file handler
-        file_handler = logging.FileHandler('logs/scraper.log')
+        file_handler = logging.FileHandler(log_path)
         file_handler.setLevel(logging.INFO)
         
         # Set up the formatter
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(formatter)
         
-        # Add the handler to the logger
-        logger = logging.getLogger('ulog_scraper')
-        logger.setLevel(logging.INFO)
-        logger.addHandler(file_handler)
+        # The file handler runs on the listener thread, fed through a queue
+        log_queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.log_path = log_path
+        
+        # Add the handler to the logger behind self.logger
+        logger.addHandler(queue_handler)
         
-        # Connect our logger to self.logger
-        self.custom_logger = logger
         self.logger.info("File logger initialized")
     
-    def log(self, message, level=logging.INFO):
+    def log(self, message, level=logging.INFO, **kw):
         """
-        Log to both Scrapy logger and our custom file logger.
+        Log to the spider logger, which writes to both the console and the log file.
+        
+        Keeps Scrapy's Spider.log signature. Messages built from values are
+        logged with self.logger.<level>("... %s", value) instead, so the
+        logging module only formats them when the level is enabled.
         
         Args:
             message (str): The message to log
             level (int): The logging level (INFO, WARNING, ERROR)
+            **kw: Passed through to Logger.log
         """
-        if level == logging.ERROR:
-            self.logger.error(message)
-            self.custom_logger.error(message)
-        elif level == logging.WARNING:
-            self.logger.warning(message)
-            self.custom_logger.warning(message)
-        else:
-            self.logger.info(message)
-            self.custom_logger.info(message)
+        self.logger.log(level, message, **kw)
+
+    def log_phase(self, phase, events, level=logging.INFO):
+        """
+        Log everything that happened during one navigation phase as a single
+        structured record instead of one record per step.
+
+        Args:
+            phase (str): Short name of the navigation phase
+            events (list): Status messages collected while the phase ran
+            level (int): The logging level (INFO, WARNING, ERROR)
+        """
+        if self.logger.isEnabledFor(level):
+            self.log(json.dumps({'phase': phase, 'events': events}), level)
+
+    def browser_stays_open(self):
+        """
+        Check whether the browser is left open when the spider closes.
+        
+        The flow flags the browser to be kept once it is logged in. It is only
+        actually kept for inspection in debug mode, or when a later run can
+        reattach to it; otherwise it goes back to the DriverPool.
         
+        Returns:
+            bool: True if closed() should leave the browser running
+        """
+        return getattr(self, 'keep_browser_open', False) and (self.debug or self.can_reattach())
+    
     def closed(self, reason):
         """
-        Handle spider close event. Keeps browser open if requested.
+        Handle spider close event. Keeps browser open if requested, otherwise
+        releases it to the DriverPool.
         
         Args:
             reason (str): Reason for spider closing
         """
-        if hasattr(self, 'keep_browser_open') and self.keep_browser_open:
+        if self.browser_stays_open():
             self.log("Spider closed but keeping browser open as requested")
             # Do not call self.driver.quit() to keep browser window open
         else:
-            # Default behavior - close the browser
-            self.driver.quit()
-            self.log(f"Spider closed: {reason}")
+            # Default behavior - hand the browser back to the pool for reuse
+            DriverPool.release(self.driver)
+            self.logger.info("Spider closed: %s", reason)
+        
+        # Let queued screenshots finish writing
+        if self._screenshot_executor is not None:
+            self._screenshot_executor.shutdown(wait=True)
     
-    def start_requests(self):
-        """Start the login process and then begin vehicle processing"""
-        self.log("Starting login process")
+    def screenshot_level(self):
+        """
+        Return which screenshots to take: 'none', 'error' or 'all'.
+        
+        Read from the SCREENSHOT_LEVEL setting. When it is not set, debug mode
+        takes all screenshots and normal runs only take error screenshots.
+        """
+        settings = getattr(self, 'settings', None)
+        level = settings.get('SCREENSHOT_LEVEL') if settings else None
+        if not level:
+            return 'all' if self.debug else 'error'
+        return str(level).lower()
+    
+    def save_screenshot(self, filename, always=False):
+        """
+        Save a screenshot of the current browser window.
+        
+        Which screenshots are taken is controlled by screenshot_level(). On
+        Chromium the capture is a JPEG taken through DevTools, which is much
+        cheaper to encode and transfer than the PNG from WebDriver, and the file
+        is decoded and written on a background thread so navigation carries on.
+        The capture itself stays on the calling thread so the screenshot shows
+        the page as it was when it was requested.
+        
+        Args:
+            filename (str): Path of the screenshot file to write; Chromium
+                            screenshots get a .jpg extension
+            always (bool): Take the screenshot at the 'error' level too,
+                           used for error states
+        """
+        level = self.screenshot_level()
+        if level == 'none' or (level == 'error' and not always):
+            return
+        try:
+            if not hasattr(self.driver, 'execute_cdp_cmd'):
+                self.driver.save_screenshot(filename)
+                self.logger.info("Saved screenshot: %s", filename)
+                return
+            
+            data = self.driver.execute_cdp_cmd('Page.captureScreenshot', {'format': 'jpeg', 'quality': 60})['data']
+            filename = os.path.splitext(filename)[0] + '.jpg'
+            if self._screenshot_executor is None:
+                self._screenshot_executor = ThreadPoolExecutor(max_workers=1)
+            self._screenshot_executor.submit(self.write_screenshot, filename, data)
+        except Exception as e:
+            self.logger.warning("Could not save screenshot %s: %s", filename, e)
+    
+    def write_screenshot(self, filename, data):
+        """
+        Decode a base64 screenshot from DevTools and write it to disk.
+        
+        Args:
+            filename (str): Path of the file to write
+            data (str): Base64-encoded image data
+        """
+        try:
+            with open(filename, 'wb') as f:
+                f.write(base64.b64decode(data))
+            self.logger.info("Saved screenshot: %s", filename)
+        except Exception as e:
+            self.logger.warning("Could not save screenshot %s: %s", filename, e)
+    
+    def first_match(self, selectors):
+        """
+        Return the first rendered element matching any of the given selectors.
+        
+        The whole selector list is evaluated inside the browser in a single
+        execute_script call instead of one find_elements round-trip per selector.
+        CSS selectors are tried before XPath expressions. Hidden elements are
+        skipped, so a hidden duplicate of a form field or button is never
+        returned.
+        
+        Args:
+            selectors (tuple): (By.CSS_SELECTOR | By.XPATH, selector) pairs
+            
+        Returns:
+            WebElement: The first matching element, or None if nothing matched
+        """
+        css_list, xpath_list = split_selectors(selectors)
+        script = _IS_VISIBLE_JS + """
+            for (const s of arguments[0]) {
+                for (const e of document.querySelectorAll(s)) {
+                    if (visible(e)) return e;
+                }
+            }
+            for (const x of arguments[1]) {
+                const r = document.evaluate(x, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                for (let i = 0; i < r.snapshotLength; i++) {
+                    if (visible(r.snapshotItem(i))) return r.snapshotItem(i);
+                }
+            }
+            return null;
+        """
+        return self.driver.execute_script(script, css_list, xpath_list)
+    
+    def find_candidates(self, selectors):
+        """
+        Find all elements matching any of the given selectors.
+        
+        The CSS selectors are combined into one group selector ("a, b, c") and the
+        XPath expressions into one union ("//a | //b"), so the whole list costs at
+        most two find_elements round-trips instead of one per selector. Within each
+        group, elements come back in document order.
+        
+        Args:
+            selectors (tuple): (By.CSS_SELECTOR | By.XPATH, selector) pairs
+            
+        Returns:
+            list: Matching WebElements, CSS matches first
+        """
+        css_group, xpath_union = join_selectors(selectors)
+        
+        candidates = []
+        if css_group:
+            candidates += self.driver.find_elements(By.CSS_SELECTOR, css_group)
+        if xpath_union:
+            candidates += self.driver.find_elements(By.XPATH, xpath_union)
+        return candidates
+    
+    def filter_visible(self, elements):
+        """
+        Keep only the visible elements, checked in one execute_script call.
+        
+        Replaces an is_displayed() round-trip per element.
+        
+        Args:
+            elements (list): WebElements to check
+            
+        Returns:
+            list: The visible elements, in their original order
+        """
+        if not elements:
+            return []
+        return self.driver.execute_script(
+            _IS_VISIBLE_JS + "return arguments[0].filter(visible);", elements)
+    
+    def candidate_metadata(self, selectors):
+        """
+        Describe every element matching the selectors in one execute_script call.
+        
+        Returns the text, href, placeholder and visibility of each candidate
+        together with the element itself, so callers can filter in Python
+        without a WebDriver round-trip per property per candidate.
+        
+        Args:
+            selectors (tuple): (By.CSS_SELECTOR | By.XPATH, selector) pairs
+            
+        Returns:
+            list: dicts with element, text, href, placeholder and visible keys,
+                  CSS matches first
+        """
+        css_list, xpath_list = split_selectors(selectors)
+        script = _IS_VISIBLE_JS + """
+            const found = [];
+            for (const s of arguments[0]) {
+                found.push(...document.querySelectorAll(s));
+            }
+            for (const x of arguments[1]) {
+                const r = document.evaluate(x, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                for (let i = 0; i < r.snapshotLength; i++) found.push(r.snapshotItem(i));
+            }
+            return [...new Set(found)].map(e => ({
+                element: e,
+                text: e.innerText || '',
+                href: e.href || null,
+                placeholder: e.placeholder || null,
+                visible: visible(e),
+            }));
+        """
+        return self.driver.execute_script(script, css_list, xpath_list)
+    
+    def first_visible_match(self, selectors, text, exclude=(), ignore_case=False, exact=False):
+        """
+        Return the first visible element matching the selectors and containing text.
+        
+        Candidate lookup, the visibility check and the text check all run inside
+        the browser in one execute_script call, instead of an is_displayed() and a
+        .text round-trip per candidate.
+        
+        Args:
+            selectors (tuple): (By.CSS_SELECTOR | By.XPATH, selector) pairs
+            text (str): Text the element's rendered text must contain
+            exclude (tuple): Texts that disqualify an element if they appear in it
+            ignore_case (bool): Compare text and exclusions case-insensitively
+            exact (bool): Require the element's whole text, with whitespace
+                          collapsed, to equal text rather than contain it
+            
+        Returns:
+            WebElement: The first matching element, or None if nothing matched
+        """
+        css_list, xpath_list = split_selectors(selectors)
+        script = _IS_VISIBLE_JS + """
+            const ignoreCase = arguments[4];
+            const exact = arguments[5];
+            const norm = t => ignoreCase ? t.toLowerCase() : t;
+            const needle = norm(arguments[2]);
+            const exclude = arguments[3].map(norm);
+            const matches = e => {
+                if (!visible(e)) return false;
+                const t = norm(e.innerText);
+                const found = exact ? t.replace(/\s+/g, ' ').trim() === needle : t.includes(needle);
+                return found && !exclude.some(x => t.includes(x));
+            };
+            for (const s of arguments[0]) {
+                for (const e of document.querySelectorAll(s)) {
+                    if (matches(e)) return e;
+                }
+            }
+            for (const x of arguments[1]) {
+                const r = document.evaluate(x, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                for (let i = 0; i < r.snapshotLength; i++) {
+                    if (matches(r.snapshotItem(i))) return r.snapshotItem(i);
+                }
+            }
+            return null;
+        """
+        return self.driver.execute_script(script, css_list, xpath_list, text, list(exclude), ignore_case, exact)
+    
+    def fill_and_submit(self, element, text):
+        """
+        Set an input's value and submit it, as typing the text and Enter would.
+        
+        send_keys costs a WebDriver command per keystroke. Here the value is set
+        and the input, change and Enter key events are dispatched in a single
+        execute_script call, whatever the length of the text. The enclosing
+        form, if any, is submitted the way pressing Enter would.
+        
+        Args:
+            element (WebElement): The input to fill
+            text (str): The text to enter
+        """
+        script = """
+            const input = arguments[0];
+            input.focus();
+            input.value = arguments[1];
+            input.dispatchEvent(new Event('input', {bubbles: true}));
+            input.dispatchEvent(new Event('change', {bubbles: true}));
+            for (const type of ['keydown', 'keypress', 'keyup']) {
+                input.dispatchEvent(new KeyboardEvent(type, {
+                    key: 'Enter', code: 'Enter', keyCode: 13, which: 13, bubbles: true, cancelable: true,
+                }));
+            }
+            if (input.form) {
+                if (input.form.requestSubmit) {
+                    input.form.requestSubmit();
+                } else {
+                    input.form.dispatchEvent(new Event('submit', {bubbles: true, cancelable: true}));
+                }
+            }
+        """
+        self.driver.execute_script(script, element, text)
+    
+    def js_click(self, element):
+        """
+        Click an element through JavaScript.
+        
+        A native click scrolls the element into view and runs actionability
+        checks over several WebDriver round-trips; for elements that were just
+        located and are known to be visible a single script call is enough.
+        
+        Args:
+            element (WebElement): The element to click
+        """
+        self.driver.execute_script("arguments[0].click();", element)
+    
+    def load_download_index(self):
+        """
+        Load the record of logs downloaded by previous runs.
         
+        Returns:
+            dict: Log page URL -> downloaded file name
+        """
+        if not os.path.exists(self.download_index_file):
+            return {}
         try:
-            # Navigate to login page
-            self.driver.get('https://suite.auterion.com/login')
-            self.log("Navigated to login page")
+            with open(self.download_index_file, 'r') as f:
+                return json.load(f)
+        except ValueError:
+            self.logger.warning("Ignoring unreadable download index: %s", self.download_index_file)
+            return {}
+    
+    def is_log_downloaded(self, log_url):
+        """
+        Check whether the log at log_url was downloaded and is still on disk.
+        
+        A browser on a Selenium server saves downloads to that machine, where
+        they cannot be checked, so the index is trusted for those.
+        
+        Args:
+            log_url (str): URL of the log's analytics page
+            
+        Returns:
+            bool: True if the download can be skipped
+        """
+        filename = self.downloaded_logs.get(log_url)
+        if not filename or self.command_executor:
+            return bool(filename)
+        return os.path.exists(os.path.join(self.download_dir, filename))
+    
+    def record_download(self, log_url, path):
+        """
+        Add a finished download to the persisted download index, and note that
+        navigation got as far as a downloaded log.
+        
+        Args:
+            log_url (str): URL of the log's analytics page
+            path (str): Path or name of the downloaded file
+        """
+        with self._state_lock:
+            self.downloaded_logs[log_url] = os.path.basename(path)
+            with open(self.download_index_file, 'w') as f:
+                json.dump(self.downloaded_logs, f, indent=2)
+            # The browser is left on the log's analytics page
+            self.save_navigation_state('log_downloaded', log_url)
+    
+    def wait_for_download(self, existing_files):
+        """
+        Wait for a new, fully written file to appear in the downloads folder.
+        
+        Chrome writes in-progress downloads to a .crdownload file and renames it
+        once complete, so large logs are waited on for exactly as long as they
+        take rather than for a fixed time. Uses the same WebDriverWait polling
+        as every other wait in the spider.
+        
+        Args:
+            existing_files (set): File names present before the download started
+            
+        Returns:
+            str: Path of the downloaded file, just its name for a browser on a
+                 Selenium server, or None on timeout
+        """
+        # The download index lives alongside the downloads
+        existing_files = set(existing_files) | {os.path.basename(self.download_index_file)}
+        try:
+            path = self.wait_with(self.download_timeout).until(
+                lambda driver: self.new_completed_file(existing_files))
+        except TimeoutException:
+            self.logger.warning("Timed out after %ss waiting for download", self.download_timeout)
+            return None
+        
+        self.logger.info("Download complete: %s", path)
+        return path
+    
+    def new_completed_file(self, existing_files):
+        """
+        Return the first finished file in the downloads folder that is not in existing_files.
+        
+        Chrome's own download progress events are checked first, as they report
+        completion the moment it happens and also work for a browser on a
+        Selenium server whose downloads folder is not on this machine. The
+        folder itself is scanned as a fallback.
+        
+        Args:
+            existing_files (set): File names to ignore
+            
+        Returns:
+            str: Path of the new file, just its name for a browser on a Selenium
+                 server, or None if there is none yet
+        """
+        self.read_performance_log()
+        while self._completed_downloads:
+            filename = self._completed_downloads.pop(0)
+            if filename and filename not in existing_files:
+                # A browser on a Selenium server saves to that machine, so only the name is known
+                if self.command_executor:
+                    return filename
+                path = os.path.join(self.download_dir, filename)
+                # Chrome renames the file if the suggested name is taken
+                if os.path.exists(path):
+                    return path
+        
+        with os.scandir(self.download_dir) as entries:
+            for entry in entries:
+                if (entry.name not in existing_files and entry.is_file()
+                        and not entry.name.endswith(('.crdownload', '.part', '.tmp'))):
+                    return entry.path
+        return None
+    
+    def browser_cookies(self):
+        """
+        Return the browser's cookies for the current site as a dict.
+        
+        Passed to Scrapy requests so they are made as the logged-in user.
+        
+        Returns:
+            dict: Cookie name -> value
+        """
+        return {cookie['name']: cookie['value'] for cookie in self.driver.get_cookies()}
+    
+    def session_request(self, url, callback, method='GET', **kwargs):
+        """
+        Build a Scrapy request made as the user logged in through the browser.
+        
+        The browser's cookies are captured once after login and attached to each
+        request, so once the browser has authenticated, pages and files can be
+        fetched by Scrapy without driving the UI.
+        
+        Args:
+            url (str): URL to fetch
+            callback (callable): Callback for the response
+            method (str): HTTP method
+            **kwargs: Passed through to scrapy.Request
             
-            # Wait for the page to load
-            time.sleep(5)
+        Returns:
+            scrapy.Request: The request
+        """
+        if self.session_cookies is None:
+            self.session_cookies = self.browser_cookies()
+        return scrapy.Request(url, method=method, cookies=self.session_cookies,
+                              callback=callback, **kwargs)
+    
+    def download_target(self, element):
+        """
+        Find the URL and HTTP method a download button would fetch.
+        
+        Looks for an enclosing link first, then an enclosing form. Buttons that
+        start the download from a JS handler have neither.
+        
+        Args:
+            element (WebElement): The Download log button
             
-            # Attempt login
-            login_success = self.perform_login()
+        Returns:
+            tuple: (url, method), or None if the button has no link or form
+        """
+        script = """
+            const link = arguments[0].closest('a[href]');
+            if (link && !link.href.startsWith('javascript:')) return [link.href, 'GET'];
+            const form = arguments[0].closest('form');
+            if (form && form.action) return [form.action, (form.method || 'get').toUpperCase()];
+            return null;
+        """
+        target = self.driver.execute_script(script, element)
+        return tuple(target) if target else None
+    
+    def read_performance_log(self):
+        """
+        Process the entries added to Chrome's performance log since the last read.
+        
+        Only page events are logged. The names of downloads Chrome has finished
+        are collected for wait_for_download.
+        """
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception:
+            return
+        
+        for entry in entries:
+            # Cheap substring checks before parsing the JSON of every event
+            raw = entry['message']
+            if 'Page.download' not in raw:
+                continue
+            message = json.loads(raw)['message']
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Page.downloadWillBegin':
+                self._download_names[params['guid']] = params.get('suggestedFilename')
+            elif method == 'Page.downloadProgress' and params.get('state') == 'completed':
+                self._completed_downloads.append(self._download_names.pop(params['guid'], None))
+    
+    def save_log_file(self, response, log_url):
+        """
+        Write a log fetched directly over HTTP to the downloads folder.
+        
+        The file name comes from the Content-Disposition header when the server
+        sends one, and from the last part of the URL otherwise.
+        
+        Args:
+            response (Response): The log file response
+            log_url (str): URL of the log's analytics page
+        """
+        disposition = response.headers.get('Content-Disposition', b'').decode('latin-1')
+        filename = None
+        if 'filename=' in disposition:
+            filename = disposition.split('filename=', 1)[1].split(';', 1)[0].strip().strip('"')
+        if not filename:
+            filename = response.url.split('?', 1)[0].rstrip('/').rsplit('/', 1)[-1] or 'log.ulg'
+        
+        path = os.path.join(self.download_dir, os.path.basename(filename))
+        with open(path, 'wb') as f:
+            f.write(response.body)
+        self.record_download(log_url, path)
+        self.logger.info("Download complete: %s", path)
+    
+    def wait_with(self, timeout=30):
+        """
+        Return the WebDriverWait for the given timeout, creating it on first use.
+        
+        One instance is kept per timeout and reused for every later wait, so
+        the navigation steps don't each build a new WebDriverWait.
+        
+        Args:
+            timeout (int): Maximum number of seconds to wait
+            
+        Returns:
+            WebDriverWait: A wait bound to this spider's driver
+        """
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = WebDriverWait(self.driver, timeout, poll_frequency=self.wait_poll_frequency,
+                                 ignored_exceptions=(StaleElementReferenceException, NoSuchElementException))
+            self._waits[timeout] = wait
+        return wait
+    
+    def wait_for(self, condition, timeout=30):
+        """
+        Wait until an expected condition is met, returning as soon as it is.
+        
+        Polls every wait_poll_frequency seconds rather than Selenium's default
+        0.5s, and retries rather than fails when the DOM re-renders mid-check.
+        
+        Args:
+            condition (callable): A Selenium expected condition, e.g.
+                                  EC.presence_of_element_located(locator)
+            timeout (int): Maximum number of seconds to wait
+            
+        Returns:
+            The condition's result (usually a WebElement), or None on timeout
+        """
+        try:
+            return self.wait_with(timeout).until(condition)
+        except TimeoutException:
+            self.logger.warning("Timed out after %ss waiting for page element", timeout)
+            return None
+    
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        spider = super(LogDownloaderSpider, cls).from_crawler(crawler, *args, **kwargs)
+        crawler.signals.connect(spider.keep_open_while_browsing, signal=signals.spider_idle)
+        return spider
+    
+    def start_requests(self):
+        """
+        Start the browser flow on a thread from the reactor's thread pool.
+        
+        Selenium calls block, so running the login and navigation on the
+        reactor thread would hold back every download until the browser was
+        done. Off the reactor, the log downloads the flow finds are handed to
+        Scrapy as they are found and downloaded while the browser moves on to
+        the next vehicle.
+        
+        Returns:
+            list: No requests; the browser flow schedules them itself
+        """
+        self._browser_flow = threads.deferToThread(self.run_browser_flow)
+        self._browser_flow.addErrback(
+            lambda failure: self.logger.error("Browser flow failed: %s", failure.getErrorMessage()))
+        return []
+    
+    def keep_open_while_browsing(self):
+        """
+        spider_idle handler: keep the spider open while the browser flow runs,
+        as it may still schedule requests.
+        """
+        if self._browser_flow is not None and not self._browser_flow.called:
+            raise DontCloseSpider
+    
+    def schedule(self, request):
+        """
+        Hand a request to the Scrapy engine from the browser flow's thread.
+        
+        Args:
+            request (scrapy.Request): The request to download
+        """
+        from twisted.internet import reactor
+        reactor.callFromThread(self.crawler.engine.crawl, request)
+    
+    def run_browser_flow(self):
+        """
+        Log in, then walk through the DV21 flow and every configured vehicle.
+        
+        Runs on a thread from the reactor's pool, see start_requests().
+        """
+        self.log("Starting login process")
+        
+        try:
+            login_success = self.login()
             
             if login_success:
                 self.log("Login successful - proceeding to process vehicles")
-                # Process the first vehicle
-                return self.process_next_vehicle()
+                # Capture the logged-in cookies once for Scrapy requests
+                self.session_cookies = self.browser_cookies()
+                # Navigate to Vehicles page and walk through the DV21 flow
+                for request in self.navigate_to_vehicles():
+                    self.schedule(request)
+                for request in self.process_all_vehicles():
+                    self.schedule(request)
             else:
                 self.log("Login failed", logging.ERROR)
-                return []
             
         except Exception as e:
-            self.log(f"Login process failed: {str(e)}", logging.ERROR)
-            return []
+            self.logger.error("Login process failed: %s", e)
+            self.save_screenshot('error_state.png', always=True)
     
-    def process_next_vehicle(self):
-        """Process the next vehicle in the queue and yield any necessary requests"""
+    def login(self):
+        """
+        Log in to Auterion Suite unless the browser session already is.
         
-        if self.current_vehicle_index >= len(self.vehicle_configs):
-            self.log("All vehicles processed, spider will close")
-            return []
+        A reattached browser is used as is. Otherwise the cookies saved by the
+        last successful login are tried before the full login flow.
+        
+        Returns:
+            bool: True if logged in, raises exception otherwise
+        """
+        if self.session_reused:
+            # The reattached browser is already logged in
+            self.log("Reusing logged-in browser session - skipping login")
+            return True
+        
+        if self.restore_cookies():
+            self.log("Restored saved login cookies - skipping login")
+            self.keep_browser_open = True
+            return True
+        
+        # Navigate to login page
+        self.driver.get('https://suite.auterion.com/login')
+        self.log("Navigated to login page")
+        
+        # Wait for the initial login button to become clickable
+        self.wait_for(EC.element_to_be_clickable((By.CSS_SELECTOR, "button.button-primary")))
+        self.save_screenshot('login_page.png')
         
-        # Get the current vehicle config
-        vehicle_name, start_date, end_date = self.vehicle_configs[self.current_vehicle_index]
-        self.log(f"Processing vehicle: {vehicle_name} for date range: {start_date} to {end_date}")
+        # Attempt login
+        return self.perform_login()
+    
+    def save_cookies(self):
+        """
+        Save the browser's cookies so a later run can skip the login flow.
+        
+        The file holds the session cookies, so it is only readable by the owner.
+        """
+        try:
+            cookies = self.driver.get_cookies()
+            fd = os.open(self.cookie_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cookies, f)
+            self.logger.info("Saved %s login cookies to %s", len(cookies), self.cookie_file)
+        except Exception as e:
+            self.logger.warning("Could not save login cookies: %s", e)
+    
+    def restore_cookies(self):
+        """
+        Load the cookies saved by a previous run into the browser.
+        
+        Cookies can only be set for the site the browser is on, so the site is
+        opened first. The session counts as restored if the Vehicles page then
+        shows its search box, which is only rendered for a logged-in user.
+        
+        Returns:
+            bool: True if the saved cookies gave a logged-in session
+        """
+        if not os.path.exists(self.cookie_file):
+            return False
+        try:
+            with open(self.cookie_file, 'r') as f:
+                cookies = json.load(f)
+        except ValueError:
+            self.logger.warning("Ignoring unreadable cookie file: %s", self.cookie_file)
+            return False
+        
+        self.driver.get('https://suite.auterion.com/')
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except WebDriverException:
+                continue  # e.g. a cookie for another domain
+        
+        self.driver.get('https://suite.auterion.com/vehicles')
+        if self.wait_for(EC.element_to_be_clickable((By.CSS_SELECTOR, "input.search")), timeout=15):
+            return True
+        self.log("Saved login cookies have expired, logging in again")
+        return False
+    
+    def process_all_vehicles(self):
+        """Process every configured vehicle in turn and yield any necessary requests"""
+        for vehicle_name, start_date, end_date in self.vehicle_configs:
+            self.process_vehicle(vehicle_name, start_date, end_date)
+        
+        self.log("Finished processing all vehicles")
+        return []
+    
+    def process_vehicle(self, vehicle_name, start_date, end_date):
+        """
+        Search for a configured vehicle on the Vehicles page.
+        
+        Downloading a vehicle's logs for its date range is not implemented yet;
+        only the DV21 flow in navigate_to_vehicles downloads logs. For now this
+        checks that each configured vehicle can be found.
+        
+        Args:
+            vehicle_name (str): Name of the vehicle to search for
+            start_date (str): Start of the date range
+            end_date (str): End of the date range
+            
+        Returns:
+            bool: True if the vehicle showed up in the search results
+        """
+        self.logger.info("Processing vehicle: %s for date range: %s to %s", vehicle_name, start_date, end_date)
         
         # Navigate to the vehicles page
         self.driver.get("https://suite.auterion.com/vehicles")
         self.log("Navigated to vehicles page")
         
-        # Wait for the page to load completely
-        WebDriverWait(self.driver, 30).until(
-            lambda driver: driver.execute_script("return document.readyState") == "complete"
-        )
-        time.sleep(5)  # Additional wait for UI elements
+        # Wait for the search input rather than for the whole page
+        self.wait_for(EC.element_to_be_clickable((By.CSS_SELECTOR, "input.search")))
         
         # Search for the vehicle
-        self.search_for_vehicle(vehicle_name)
-        
-        # Navigate to vehicle logs and download them
-        logs_downloaded = self.navigate_to_vehicle_logs(vehicle_name, start_date, end_date)
-        
-        # Increment the index for the next vehicle
-        self.current_vehicle_index += 1
-        
-        # After we're done with this vehicle, recursively process the next one
-        if self.current_vehicle_index < len(self.vehicle_configs):
-            return self.process_next_vehicle()
-        else:
-            self.log("Finished processing all vehicles")
-            return []
+        return self.search_for_vehicle(vehicle_name) is not None
     
     def perform_login(self):
         """
@@ -241,7 +1539,9 @@ class LogDownloaderSpider(scrapy.Spider):
         4. Find and fill password field
         5. Click final submit button
         6. Wait for successful login
-        7. Navigate to vehicles page and stop
+        
+        Each field is looked up with its module-level selector list, which is
+        ordered most likely and cheapest first (see the note above the lists).
         
         Returns:
             bool: True if login was successful, raises exception otherwise
@@ -252,45 +1552,22 @@ class LogDownloaderSpider(scrapy.Spider):
         self.log("Step 1: Finding initial login button")
         try:
             # Try multiple selectors for the initial login button
-            selectors_to_try = [
-                (By.CSS_SELECTOR, "button.button-primary"),
-                (By.XPATH, "//button[contains(text(), 'Login')]"),
-                (By.XPATH, "//button[normalize-space()='Login']")
-            ]
-            
-            login_button = None
-            for selector_type, selector in selectors_to_try:
-                elements = self.driver.find_elements(selector_type, selector)
-                if elements:
-                    login_button = elements[0]
-                    break
+            login_button = self.first_match(_LOGIN_BUTTON_SELECTORS)
             
             if not login_button:
                 self.log("Could not find initial login button", logging.ERROR)
                 raise Exception("Could not find login button")
             
-            login_button.click()
+            self.js_click(login_button)
             self.log("Clicked login button, waiting for email form")
             
             # Step 2: Find and fill email field
             self.log("Step 2: Looking for email input field")
-            email_selectors = [
-                (By.CSS_SELECTOR, "input[type='email']"),
-                (By.CSS_SELECTOR, "input[name='email']"),
-                (By.XPATH, "//input[@type='email']"),
-                (By.CSS_SELECTOR, "input[name='username']"),
-                (By.XPATH, "//input[@name='username']")
-            ]
-            
-            email_input = None
-            for selector_type, selector in email_selectors:
-                elements = self.driver.find_elements(selector_type, selector)
-                if elements:
-                    email_input = elements[0]
-                    break
+            email_input = self.wait_for(lambda driver: self.first_match(_EMAIL_SELECTORS), timeout=10)
             
             if not email_input:
                 self.log("Could not find email input field", logging.ERROR)
+                self.log_page_inputs()
                 raise Exception("Email input field not found")
             
             # Enter email
@@ -300,48 +1577,24 @@ class LogDownloaderSpider(scrapy.Spider):
             
             # Step 3: Look for continue button after entering email
             self.log("Looking for continue/next button after email entry")
-            continue_selectors = [
-                (By.CSS_SELECTOR, "button[type='submit']"),
-                (By.XPATH, "//button[contains(text(), 'Continue')]"),
-                (By.XPATH, "//button[contains(text(), 'Next')]")
-            ]
-            
-            continue_button = None
-            for selector_type, selector in continue_selectors:
-                elements = self.driver.find_elements(selector_type, selector)
-                if elements:
-                    continue_button = elements[0]
-                    break
+            continue_button = self.first_match(_CONTINUE_SELECTORS)
             
             if not continue_button:
                 self.log("No continue button found, trying to submit with Enter key", logging.WARNING)
                 email_input.send_keys(Keys.RETURN)
             else:
-                continue_button.click()
+                self.js_click(continue_button)
                 self.log("Clicked continue button")
             
             # Step 3: Wait for password field and enter password
             self.log("Step 3: Waiting for password field")
-            time.sleep(3)
             
             # Try to find password field
-            password_selectors = [
-                (By.CSS_SELECTOR, "input[type='password']"),
-                (By.XPATH, "//input[@type='password']"),
-                (By.CSS_SELECTOR, "input[name='password']")
-            ]
-            
-            password_input = None
-            for selector_type, selector in password_selectors:
-                try:
-                    wait = WebDriverWait(self.driver, 5)
-                    password_input = wait.until(EC.presence_of_element_located((selector_type, selector)))
-                    break
-                except:
-                    continue
+            password_input = self.wait_for(lambda driver: self.first_match(_PASSWORD_SELECTORS), timeout=15)
             
             if not password_input:
                 self.log("Could not find password field", logging.ERROR)
+                self.log_page_inputs()
                 raise Exception("Password field not found")
             
             # Enter password
@@ -351,203 +1604,165 @@ class LogDownloaderSpider(scrapy.Spider):
             
             # Look for login/submit button
             self.log("Looking for final submit button")
-            submit_selectors = [
-                (By.CSS_SELECTOR, "button[type='submit']"),
-                (By.XPATH, "//button[contains(text(), 'Sign in')]"),
-                (By.XPATH, "//button[contains(text(), 'Login')]")
-            ]
-            
-            submit_button = None
-            for selector_type, selector in submit_selectors:
-                elements = self.driver.find_elements(selector_type, selector)
-                if elements:
-                    submit_button = elements[0]
-                    break
+            submit_button = self.first_match(_SUBMIT_SELECTORS)
             
             if not submit_button:
                 self.log("No submit button found, trying to submit with Enter key", logging.WARNING)
                 password_input.send_keys(Keys.RETURN)
             else:
-                submit_button.click()
+                self.js_click(submit_button)
                 self.log("Clicked submit button")
             
             # Wait for successful login with a longer timeout (3 minutes)
             self.log("Waiting for successful login (up to 3 minutes)")
             try:
                 # Wait longer as requested - 180 seconds = 3 minutes
-                WebDriverWait(self.driver, 180).until(
-                    lambda driver: 'suite.auterion.com' in driver.current_url and 
-                                  driver.execute_script("return document.readyState") == "complete"
-                )
+                def logged_in_url(driver):
+                    # Return the URL the check read, so it isn't fetched again for logging
+                    url = driver.current_url
+                    if 'suite.auterion.com' in url and driver.execute_script("return document.readyState") == "complete":
+                        return url
+                    return False
+                
+                login_url = self.wait_with(180).until(logged_in_url)
                 self.log("Login appears successful! Page loaded completely.")
-                self.log(f"Current URL after login: {self.driver.current_url}")
+                self.logger.info("Current URL after login: %s", login_url)
+                self.save_screenshot('post_login_state.png')
                 
-                # Navigate to Vehicles page and stop
-                self.navigate_to_vehicles()
+                # Let the dashboard's API calls settle, but don't fail the login if
+                # it keeps polling and the network never goes quiet
+                try:
+                    self.wait_with(self.network_idle_timeout).until(self.is_network_idle)
+                except TimeoutException:
+                    self.logger.info("Network still busy after %ss, continuing", self.network_idle_timeout)
                 
-                # Flag to keep browser open - this is already set in navigate_to_vehicles()
+                # Flag to keep browser open so the next run can reattach to it
                 self.keep_browser_open = True
+                # Save the session cookies in case the browser is gone by then
+                self.save_cookies()
                 
                 # Return True to indicate successful login
                 return True
                 
             except Exception as e:
-                self.log(f"Login completion detection failed: {str(e)}", logging.ERROR)
+                self.logger.error("Login completion detection failed: %s", e)
                 raise Exception(f"Login process failed - could not verify successful page load: {str(e)}")
             
         except Exception as e:
-            self.log(f"Error during login process: {str(e)}", logging.ERROR)
+            self.logger.error("Error during login process: %s", e)
+            self.save_screenshot('login_error.png', always=True)
             raise
     
+    def log_page_inputs(self):
+        """
+        Log the type, name and placeholder of every input on the current page.
+        
+        Used to diagnose a failed field lookup. All attributes are collected in a
+        single execute_script call rather than three get_attribute round-trips
+        per input.
+        """
+        attrs = self.driver.execute_script("""
+            return Array.from(document.querySelectorAll('input')).map(i =>
+                ({type: i.type, name: i.name, placeholder: i.placeholder}));
+        """)
+        self.logger.info("Found %s input fields on the page", len(attrs))
+        for i, a in enumerate(attrs):
+            self.logger.info("Input %s: %s", i, a)
+    
     def navigate_to_vehicles(self):
         """
         Navigate to the Vehicles page, search for 'dv21', click on the specific vehicle,
         click on "All Flights" button, click on the MXNT flight entry, click on the "log" button,
         click on "View Analytics", and finally click on "Download log".
+        
+        When the Download log button is a link or a form, the log is fetched by
+        Scrapy with the browser's session cookies instead of by clicking it.
+        
+        Returns:
+            list: Scrapy requests for log downloads that were not done in the browser
         """
         self.log("Attempting to navigate to Vehicles page")
+        download_requests = []
+        
+        # A reattached browser may already be on the page of a log a previous run downloaded
+        state = self.load_navigation_state()
+        if (state.get('last_step') == 'log_downloaded' and self.driver.current_url == state.get('url')
+                and self.is_log_downloaded(state['url'])):
+            self.logger.info("Navigation already completed in this browser, skipping: %s", state['url'])
+            self.keep_browser_open = True
+            return download_requests
+        
         try:
-            # First ensure the page is fully loaded after login
-            self.log("Ensuring page is fully loaded")
-            WebDriverWait(self.driver, 30).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
-            time.sleep(5)  # Additional wait to ensure UI elements are rendered
-            
             # Directly navigate to Vehicles page
-            self.log("Direct navigation to Vehicles page")
+            phase_events = ["Direct navigation to Vehicles page"]
             self.driver.get("https://suite.auterion.com/vehicles")
             
-            # Wait for the Vehicles page to load
-            self.log("Waiting for Vehicles page to load")
-            WebDriverWait(self.driver, 30).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
-            time.sleep(5)  # Additional wait to ensure UI elements are rendered
+            # Wait for the search input the next step queries
+            self.wait_for(EC.element_to_be_clickable((By.CSS_SELECTOR, "input.search")))
             
-            self.log(f"Current URL after direct navigation: {self.driver.current_url}")
+            current_url = self.driver.current_url
+            phase_events.append(f"Current URL after direct navigation: {current_url}")
+            self.log_phase('vehicles_page', phase_events)
+            self.save_screenshot('vehicles_page_direct.png')
             
             # STEP 1: Search for DV21
-            self.log("Looking for search input field")
-            search_input_selectors = [
-                (By.CSS_SELECTOR, "input[placeholder='dv21']"),
-                (By.CSS_SELECTOR, "input.search"),
-                (By.XPATH, "//div[@class='search']//input"),
-                (By.CSS_SELECTOR, "input[type='text']")
-            ]
-            
+            phase_events = []
             search_input = None
-            for selector_type, selector in search_input_selectors:
-                elements = self.driver.find_elements(selector_type, selector)
-                for element in elements:
-                    if element.is_displayed():
-                        search_input = element
-                        break
-                if search_input:
+            for candidate in self.candidate_metadata(_VEHICLE_SEARCH_SELECTORS):
+                if candidate['visible']:
+                    phase_events.append(f"Found search input with placeholder: {candidate['placeholder']}")
+                    search_input = candidate['element']
                     break
             
             # If we found the search input, enter "dv21" and press Enter
             if search_input:
-                self.log("Entering 'dv21' in search field")
-                search_input.clear()
-                search_input.send_keys("dv21")
-                time.sleep(1)  # Brief pause
-                self.log("Submitting search")
-                search_input.send_keys(Keys.RETURN)
+                self.fill_and_submit(search_input, "dv21")
+                phase_events.append("Submitted search for 'dv21'")
                 
-                # Wait for search results to load
-                self.log("Waiting for search results to load")
-                WebDriverWait(self.driver, 30).until(
-                    lambda driver: driver.execute_script("return document.readyState") == "complete"
-                )
-                time.sleep(5)  # Additional wait for AJAX results
+                # Wait for the DV21 link to appear in the search results
+                self.wait_for(EC.element_to_be_clickable((By.XPATH, "//a[contains(., 'DV21')]")))
+                self.log_phase('vehicle_search', phase_events)
             else:
-                self.log("No search input found, skipping search", logging.WARNING)
+                phase_events.append("No search input found, skipping search")
+                self.log_phase('vehicle_search', phase_events, logging.WARNING)
             
             # STEP 2: Find and click on "Astro DV21 (Nate)" link within the All Vehicles section
-            self.log("Looking for 'Astro DV21 (Nate)' link")
-            dv21_link_selectors = [
-                (By.CSS_SELECTOR, "a[href='/vehicles/1661']"),
-                (By.XPATH, "//a[contains(@href, '/vehicles/1661')]"),
-                (By.XPATH, "//a[contains(text(), 'Astro DV21')]"),
-                (By.XPATH, "//a[contains(., 'DV21')]")
-            ]
-            
-            dv21_link = None
-            for selector_type, selector in dv21_link_selectors:
-                elements = self.driver.find_elements(selector_type, selector)
-                for element in elements:
-                    if element.is_displayed() and "DV21" in element.text:
-                        dv21_link = element
-                        break
-                if dv21_link:
-                    break
+            phase_events = []
+            dv21_link = self.first_visible_match(_DV21_LINK_SELECTORS, "DV21")
                 
             # If we found the link, click on it
             if dv21_link:
-                self.log("Clicking on 'Astro DV21 (Nate)' link")
-                dv21_link.click()
+                self.js_click(dv21_link)
+                phase_events.append("Clicked 'Astro DV21 (Nate)' link")
                 
-                # Wait for vehicle details page to load
-                self.log("Waiting for vehicle details page to load")
-                WebDriverWait(self.driver, 30).until(
-                    lambda driver: driver.execute_script("return document.readyState") == "complete"
-                )
-                time.sleep(8)  # Longer wait to ensure all content is loaded
+                # Wait for the "All Flights" link on the vehicle details page
+                self.wait_for(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'All Flights')]")))
                 
-                self.log(f"Current URL after clicking DV21 link: {self.driver.current_url}")
+                current_url = self.driver.current_url
+                phase_events.append(f"Current URL after clicking DV21 link: {current_url}")
+                self.log_phase('dv21_link', phase_events)
+                self.save_screenshot('astro_dv21_details.png')
                 
                 # STEP 3: Find and click on "All Flights" link
-                self.log("Looking for 'All Flights' link")
-                all_flights_selectors = [
-                    (By.CSS_SELECTOR, "a[href='/flights?vehicle=1661&showRoute=true']"),
-                    (By.XPATH, "//a[contains(@href, '/flights?vehicle=1661')]"),
-                    (By.XPATH, "//a[contains(@class, 'button-link') and contains(text(), 'All Flights')]"),
-                    (By.XPATH, "//a[text()='All Flights']")
-                ]
-                
-                all_flights_link = None
-                for selector_type, selector in all_flights_selectors:
-                    elements = self.driver.find_elements(selector_type, selector)
-                    for element in elements:
-                        if element.is_displayed() and "All Flights" in element.text:
-                            all_flights_link = element
-                            break
-                    if all_flights_link:
-                        break
+                phase_events = []
+                all_flights_link = self.first_visible_match(_ALL_FLIGHTS_SELECTORS, "All Flights")
                 
                 # If we found the All Flights link, click on it
                 if all_flights_link:
-                    self.log("Clicking on 'All Flights' link")
-                    all_flights_link.click()
+                    self.js_click(all_flights_link)
+                    phase_events.append("Clicked 'All Flights' link")
                     
-                    # Wait for flights page to load
-                    self.log("Waiting for flights page to load")
-                    WebDriverWait(self.driver, 30).until(
-                        lambda driver: driver.execute_script("return document.readyState") == "complete"
-                    )
-                    time.sleep(8)  # Longer wait to ensure all content is loaded
+                    # Wait for a flight row containing MXNT
+                    self.wait_for(EC.element_to_be_clickable((By.XPATH, "//tr[contains(., 'MXNT')]")))
                     
-                    self.log(f"Current URL after clicking All Flights link: {self.driver.current_url}")
+                    current_url = self.driver.current_url
+                    phase_events.append(f"Current URL after clicking All Flights link: {current_url}")
+                    self.log_phase('all_flights', phase_events)
+                    self.save_screenshot('astro_dv21_flights.png')
                     
                     # STEP 4: Find and click on the MXNT flight entry
-                    self.log("Looking for MXNT flight entry")
-                    mxnt_flight_selectors = [
-                        (By.XPATH, "//tr[contains(., 'MXNT')]"),
-                        (By.XPATH, "//a[contains(., 'MXNT')]"),
-                        (By.XPATH, "//td[contains(., 'MXNT')]/parent::tr"),
-                        (By.XPATH, "//span[contains(text(), 'MXNT')]/ancestor::tr")
-                    ]
-                    
-                    mxnt_flight_element = None
-                    for selector_type, selector in mxnt_flight_selectors:
-                        elements = self.driver.find_elements(selector_type, selector)
-                        for element in elements:
-                            if element.is_displayed() and "MXNT" in element.text:
-                                mxnt_flight_element = element
-                                break
-                        if mxnt_flight_element:
-                            break
+                    phase_events = []
+                    mxnt_flight_element = self.first_visible_match(_MXNT_FLIGHT_SELECTORS, "MXNT")
                     
                     # If we found the MXNT flight element, click on it
                     if mxnt_flight_element:
@@ -555,181 +1770,243 @@ class LogDownloaderSpider(scrapy.Spider):
                         try:
                             # First try to find a link within the element
                             clickable = mxnt_flight_element.find_element(By.TAG_NAME, "a")
-                            self.log("Found clickable link within MXNT flight row")
+                            phase_events.append("Found clickable link within MXNT flight row")
                         except:
                             # If no link found, use the element itself
                             clickable = mxnt_flight_element
-                            self.log("Using the flight row element directly for clicking")
+                            phase_events.append("Using the flight row element directly for clicking")
                         
-                        self.log("Clicking on MXNT flight entry")
-                        clickable.click()
+                        self.js_click(clickable)
+                        phase_events.append("Clicked MXNT flight entry")
                         
-                        # Wait for flight details page to load
-                        self.log("Waiting for flight details page to load")
-                        WebDriverWait(self.driver, 30).until(
-                            lambda driver: driver.execute_script("return document.readyState") == "complete"
-                        )
-                        time.sleep(8)  # Longer wait to ensure all content is loaded
+                        # Wait for the "log" link on the flight details page
+                        self.wait_for(EC.element_to_be_clickable((By.CSS_SELECTOR, "a[href*='/logs']")))
                         
-                        self.log(f"Current URL after clicking MXNT flight: {self.driver.current_url}")
+                        current_url = self.driver.current_url
+                        phase_events.append(f"Current URL after clicking MXNT flight: {current_url}")
+                        self.log_phase('mxnt_flight', phase_events)
+                        self.save_screenshot('mxnt_flight_details.png')
                         
                         # STEP 5: Find and click on the "log" button
-                        self.log("Looking for 'log' button")
-                        log_button_selectors = [
-                            (By.CSS_SELECTOR, "a[href*='/logs']"),
-                            (By.XPATH, "//a[contains(@href, '/logs')]"),
-                            (By.XPATH, "//a[text()='log']"),
-                            (By.XPATH, "//span[text()='log']")
-                        ]
-                        
-                        log_button = None
-                        for selector_type, selector in log_button_selectors:
-                            elements = self.driver.find_elements(selector_type, selector)
-                            for element in elements:
-                                if element.is_displayed():
-                                    # Check if the element contains 'log' text but not as part of a longer word
-                                    text = element.text.lower()
-                                    if "log" in text and not any(x in text for x in ["login", "logout", "catalog"]):
-                                        log_button = element
-                                        break
-                            if log_button:
-                                break
+                        phase_events = []
+                        # Match 'log' but not as part of a longer word like login
+                        log_button = self.first_visible_match(_LOG_BUTTON_SELECTORS, "log",
+                                                              exclude=("login", "logout", "catalog"), ignore_case=True)
                         
                         # If we found the log button, click on it
                         if log_button:
-                            self.log("Clicking on 'log' button")
                             log_button.click()
+                            phase_events.append("Clicked 'log' button")
                             
-                            # Wait for logs page to load
-                            self.log("Waiting for logs page to load")
-                            WebDriverWait(self.driver, 30).until(
-                                lambda driver: driver.execute_script("return document.readyState") == "complete"
-                            )
-                            time.sleep(8)  # Longer wait to ensure all content is loaded
+                            # Wait for the "View Analytics" button on the logs page
+                            self.wait_for(EC.element_to_be_clickable((By.XPATH, "//*[contains(text(), 'View Analytics')]")))
                             
-                            self.log(f"Current URL after clicking log button: {self.driver.current_url}")
+                            current_url = self.driver.current_url
+                            phase_events.append(f"Current URL after clicking log button: {current_url}")
+                            self.log_phase('log_button', phase_events)
+                            self.save_screenshot('mxnt_flight_logs.png')
                             
                             # STEP 6: Find and click on "View Analytics" button
-                            self.log("Looking for 'View Analytics' button")
-                            view_analytics_selectors = [
-                                (By.XPATH, "//span[contains(text(), 'View Analytics')]"),
-                                (By.XPATH, "//a[contains(text(), 'View Analytics')]"),
-                                (By.XPATH, "//*[contains(text(), 'View Analytics')]")
-                            ]
-                            
-                            view_analytics_button = None
-                            for selector_type, selector in view_analytics_selectors:
-                                elements = self.driver.find_elements(selector_type, selector)
-                                for element in elements:
-                                    if element.is_displayed() and "View Analytics" in element.text:
-                                        view_analytics_button = element
-                                        break
-                                if view_analytics_button:
-                                    break
+                            phase_events = []
+                            view_analytics_button = self.first_visible_match(_VIEW_ANALYTICS_SELECTORS, "View Analytics")
                             
                             # If we found the View Analytics button, click on it
                             if view_analytics_button:
-                                self.log("Clicking on 'View Analytics' button")
                                 view_analytics_button.click()
+                                phase_events.append("Clicked 'View Analytics' button")
                                 
-                                # Wait for analytics page to load
-                                self.log("Waiting for analytics page to load")
-                                WebDriverWait(self.driver, 30).until(
-                                    lambda driver: driver.execute_script("return document.readyState") == "complete"
-                                )
-                                time.sleep(8)  # Longer wait to ensure all content is loaded
+                                # Wait for the "Download log" button on the analytics page
+                                self.wait_for(EC.element_to_be_clickable((By.XPATH, _DOWNLOAD_READY_XPATH)))
                                 
-                                self.log(f"Current URL after clicking View Analytics button: {self.driver.current_url}")
+                                # The analytics page URL also identifies the log in the download index
+                                log_url = current_url = self.driver.current_url
+                                phase_events.append(f"Current URL after clicking View Analytics button: {log_url}")
+                                self.log_phase('view_analytics', phase_events)
+                                self.save_screenshot('mxnt_flight_analytics.png')
                                 
                                 # STEP 7: Find and click on the "Download log" button
-                                self.log("Looking for 'Download log' button")
-                                download_log_selectors = [
-                                    (By.XPATH, "//span[contains(text(), 'Download log')]"),
-                                    (By.XPATH, "//button[contains(., 'Download log')]"),
-                                    (By.XPATH, "//span[text()='Download log']"),
-                                    (By.XPATH, "//*[contains(text(), 'Download')]")
-                                ]
-                                
-                                download_log_button = None
-                                for selector_type, selector in download_log_selectors:
-                                    elements = self.driver.find_elements(selector_type, selector)
-                                    for element in elements:
-                                        if element.is_displayed() and "Download" in element.text:
-                                            download_log_button = element
-                                            break
-                                    if download_log_button:
-                                        break
+                                phase_events = []
                                 
-                                # If we found the Download log button, click on it
-                                if download_log_button:
-                                    self.log("Clicking on 'Download log' button")
-                                    download_log_button.click()
+                                # Skip logs a previous run already downloaded
+                                if self.is_log_downloaded(log_url):
+                                    phase_events.append(f"Log already downloaded, skipping: {log_url}")
+                                    self.log_phase('download_log', phase_events)
+                                    self.save_navigation_state('log_downloaded', log_url)
+                                else:
+                                    download_log_button = self.first_visible_match(_DOWNLOAD_LOG_SELECTORS, "Download log", exact=True)
+                                    download_target = self.download_target(download_log_button) if download_log_button else None
                                     
-                                    # Wait a moment for the download to start
-                                    time.sleep(5)
+                                    # Fetch the log directly over HTTP when the button is a plain link or form
+                                    if download_target:
+                                        download_url, method = download_target
+                                        download_requests.append(self.session_request(
+                                            download_url, self.save_log_file, method=method,
+                                            cb_kwargs={'log_url': log_url}, dont_filter=True,
+                                            meta={'download_timeout': self.http_download_timeout,
+                                                  # The user's own logs, fetched as the logged-in user
+                                                  'dont_obey_robotstxt': True}))
+                                        phase_events.append(f"Queued direct download: {method} {download_url}")
+                                        self.log_phase('download_log', phase_events)
                                     
-                                    self.log(f"Current URL after clicking Download log button: {self.driver.current_url}")
-                                    self.log("Log file should now be downloading to your downloads folder")
-                                else:
-                                    self.log("Could not find Download log button", logging.WARNING)
+                                    # Otherwise click the Download log button and let Chrome fetch it
+                                    elif download_log_button:
+                                        existing_files = set(os.listdir(self.download_dir))
+                                        download_log_button.click()
+                                        phase_events.append("Clicked 'Download log' button")
+                                        
+                                        # Wait for the log file to land in the downloads folder
+                                        downloaded_path = self.wait_for_download(existing_files)
+                                        if downloaded_path:
+                                            self.record_download(log_url, downloaded_path)
+                                        
+                                        phase_events.append(f"Log file downloads to: {self.download_dir}")
+                                        self.log_phase('download_log', phase_events)
+                                        self.save_screenshot('log_download_initiated.png')
+                                    else:
+                                        phase_events.append("Could not find Download log button")
+                                        self.log_phase('download_log', phase_events, logging.WARNING)
                             else:
-                                self.log("Could not find View Analytics button", logging.WARNING)
+                                phase_events.append("Could not find View Analytics button")
+                                self.log_phase('view_analytics', phase_events, logging.WARNING)
                         else:
-                            self.log("Could not find log button", logging.WARNING)
+                            phase_events.append("Could not find log button")
+                            self.log_phase('log_button', phase_events, logging.WARNING)
                     else:
-                        self.log("Could not find MXNT flight entry", logging.WARNING)
+                        phase_events.append("Could not find MXNT flight entry")
+                        self.log_phase('mxnt_flight', phase_events, logging.WARNING)
                 else:
-                    self.log("Could not find All Flights link", logging.WARNING)
+                    phase_events.append("Could not find All Flights link")
+                    self.log_phase('all_flights', phase_events, logging.WARNING)
             else:
-                self.log("Could not find DV21 link, will not navigate to details page", logging.WARNING)
+                phase_events.append("Could not find DV21 link, will not navigate to details page")
+                self.log_phase('dv21_link', phase_events, logging.WARNING)
             
             # Set flag to keep browser open
             self.keep_browser_open = True
             
-            # Create a file to signal we're keeping the browser open
-            with open('browser_open.txt', 'w') as f:
-                f.write(f"Browser remains open with session at: {self.driver.current_url}\n")
-                f.write("Navigation completed through: Vehicles page -> DV21 details -> All Flights -> MXNT flight -> Logs -> View Analytics -> Download log\n")
-                f.write("Script has finished execution, but browser should remain open.\n")
-                f.write("Close browser manually when finished examining.")
-            
-            self.log("Script execution complete - browser window will remain open for manual inspection")
+            if self.browser_stays_open():
+                # Create a file to signal we're keeping the browser open
+                self.write_browser_marker(current_url)
+                self.log("Script execution complete - browser window will remain open for manual inspection")
+            else:
+                self.log("Script execution complete")
             
         except Exception as e:
-            self.log(f"Error in navigation process: {str(e)}", logging.ERROR)
+            self.logger.error("Error in navigation process: %s", e)
+            self.save_screenshot('error_state.png', always=True)
+        
+        return download_requests
 
+    def can_reattach(self):
+        """
+        Check whether a later run can reattach to this spider's browser session.
+        
+        A local Chrome is driven through a chromedriver that Selenium stops when
+        this process exits, which ends the session with it. Sessions on a
+        Selenium server outlive the process.
+        
+        Returns:
+            bool: True if the session is on a Selenium server
+        """
+        return not isinstance(self.driver, webdriver.Chrome)
+    
+    def write_browser_marker(self, current_url):
+        """
+        Write the browser marker file describing the browser left open.
+        
+        The content is built up front and written with a single unbuffered
+        write. It is skipped when this process already wrote identical content.
+        
+        Args:
+            current_url (str): URL the browser was left on
+        """
+        content = (
+            f"Browser remains open with session at: {current_url}\n"
+            "Navigation completed through: Vehicles page -> DV21 details -> All Flights -> MXNT flight -> Logs -> View Analytics -> Download log\n"
+            "Script has finished execution, but browser should remain open.\n"
+            "Close browser manually when finished examining.\n"
+        ).encode('utf-8')
+        if self.can_reattach():
+            # Saved so the next run can reattach instead of logging in again
+            self.save_browser_session()
+        if LogDownloaderSpider._browser_marker_content == content:
+            return
+        
+        with open(self.browser_marker_file, 'wb', buffering=0) as f:
+            f.write(content)
+        LogDownloaderSpider._browser_marker_content = content
+    
+    def save_browser_session(self):
+        """
+        Save the WebDriver session details for read_browser_session.
+        
+        Anyone holding the session id can drive the logged-in browser, so the
+        file lives under logs/ with the cookies and is only readable by the owner.
+        """
+        fd = os.open(self.browser_session_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'command_executor': executor_url(self.driver.command_executor),
+                       'session_id': self.driver.session_id}, f)
+    
+    def load_navigation_state(self):
+        """
+        Load the last navigation milestone reached, as saved by save_navigation_state.
+        
+        The only milestone saved is 'log_downloaded', once a log's file is on
+        disk, so a reattached browser still on that log's page can skip the flow.
+        
+        Returns:
+            dict: {'last_step': ..., 'url': ...}, or {} if nothing was saved
+        """
+        if not os.path.exists(self.navigation_state_file):
+            return {}
+        try:
+            with open(self.navigation_state_file, 'r') as f:
+                return json.load(f)
+        except ValueError:
+            return {}
+    
+    def save_navigation_state(self, step, url):
+        """
+        Record a navigation milestone and the page it was reached on.
+        
+        Args:
+            step (str): Milestone name, e.g. 'log_downloaded'
+            url (str): URL of the page the milestone was reached on
+        """
+        with self._state_lock, open(self.navigation_state_file, 'w') as f:
+            json.dump({'last_step': step, 'url': url}, f)
+    
     def search_for_vehicle(self, vehicle_name):
-        """Search for a specific vehicle by name in the vehicles page"""
-        self.log(f"Searching for vehicle: {vehicle_name}")
+        """
+        Search for a specific vehicle by name in the vehicles page.
+        
+        Waits until a vehicle link matching the name shows up in the results,
+        rather than for the document to be ready plus a fixed delay; the SPA
+        renders results after readyState is already complete.
+        
+        Args:
+            vehicle_name (str): Name of the vehicle to search for
+            
+        Returns:
+            WebElement: The first matching vehicle link, or None if none appeared
+        """
+        self.logger.info("Searching for vehicle: %s", vehicle_name)
         
         # Look for search input
-        search_input_selectors = [
-            (By.CSS_SELECTOR, "input[type='text']"),
-            (By.CSS_SELECTOR, "input.search"),
-            (By.XPATH, "//div[@class='search']//input")
-        ]
-        
-        search_input = None
-        for selector_type, selector in search_input_selectors:
-            elements = self.driver.find_elements(selector_type, selector)
-            for element in elements:
-                if element.is_displayed():
-                    search_input = element
-                    break
-            if search_input:
-                break
+        visible_inputs = self.filter_visible(self.find_candidates(_SEARCH_INPUT_SELECTORS))
+        search_input = visible_inputs[0] if visible_inputs else None
         
         if search_input:
-            self.log(f"Entering '{vehicle_name}' in search field")
-            search_input.clear()
-            search_input.send_keys(vehicle_name)
-            time.sleep(1)
-            search_input.send_keys(Keys.RETURN)
-            
-            # Wait for search results
-            WebDriverWait(self.driver, 30).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
-            time.sleep(5)
+            self.logger.info("Entering '%s' in search field", vehicle_name)
+            self.fill_and_submit(search_input, vehicle_name)
+            
+            # Wait for a matching vehicle in the search results
+            result = self.wait_for(lambda driver: self.first_visible_match(
+                _VEHICLE_RESULT_SELECTORS, vehicle_name, ignore_case=True))
+            if not result:
+                self.logger.warning("No search results for vehicle: %s", vehicle_name)
+            return result
         else:
-            self.log("No search input found", logging.WARNING)
\ No newline at end of file
+            self.log("No search input found", logging.WARNING)
+            return None